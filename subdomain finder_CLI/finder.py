@@ -1,148 +1,367 @@
 #!/usr/bin/env python3
 
 import argparse
-import socket
+import asyncio
+import ipaddress
+import logging
+import mmap
+import os
+import stat
+import aiodns # 3.x; 4.x deprecates DNSResolver.query(), see README
 import requests
-import concurrent.futures
+import secrets
 import sys
+import threading
 import time
-from queue import Queue
+from contextlib import contextmanager
+from itertools import chain
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import ijson # Optional: parses crt.sh's JSON array as it streams in
+    # ijson's JSONError (and IncompleteJSONError) derive from Exception, not ValueError
+    _JSON_ERRORS = (ValueError, ijson.JSONError)
+except ImportError:
+    ijson = None
+    _JSON_ERRORS = (ValueError,)
+
+try:
+    import orjson # Optional: faster decoding when the crt.sh response is parsed in one go
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
+
+try:
+    import uvloop # Optional: libuv-backed event loop, faster with thousands of in-flight UDP queries
+except ImportError:
+    uvloop = None
 
 # --- Configuration ---
-DEFAULT_THREADS = 10
+DEFAULT_CONCURRENCY = 2000  # max in-flight DNS queries during brute-forcing
 DEFAULT_TIMEOUT = 2  # seconds for DNS resolution
 CRTSH_URL = "https://crt.sh/?q=%.{domain}&output=json"
+CRTSH_TIMEOUT = 15  # seconds; crt.sh is slow, so this is deliberately separate from the DNS timeout
 USER_AGENT = "SubdomainCLI/1.0 (+https://github.com/yourusername/subdomain_cli)" # Be a good internet citizen
 
+# Shared HTTP session so connections (and their TLS handshakes) are reused across requests
+_session = requests.Session()
+_session.headers.update({'User-Agent': USER_AGENT, 'Accept-Encoding': 'gzip'})
+_session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=16,
+                                       max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])))
+
+log = logging.getLogger("subfinder")
+
 # --- Helper Functions ---
-def print_message(message, verbose=False, is_verbose_msg=False):
-    """Prints messages, respecting verbosity."""
-    if is_verbose_msg:
-        if verbose:
-            print(f"[*] {message}", file=sys.stderr)
-    else:
-        print(message)
+def positive_int(value):
+    """argparse type for counts that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+def load_resolvers(resolvers_path):
+    """
+    Reads nameserver IPs from a file, one per line ('#' starts a comment).
+    Returns a list of IPs, empty on error.
+    """
+    try:
+        with open(resolvers_path, 'r') as f:
+            lines = [line.split('#', 1)[0].strip() for line in f]
+    except FileNotFoundError:
+        log.error("Error: Resolvers file not found at '%s'", resolvers_path)
+        return []
+    except Exception as e:
+        log.error("Error reading resolvers file: %s", e)
+        return []
+
+    nameservers = []
+    for lineno, ns in enumerate(lines, 1):
+        if not ns:
+            continue
+        # c-ares only accepts literal addresses; hostnames or typos would fail deep inside the event loop
+        try:
+            ipaddress.ip_address(ns)
+        except ValueError:
+            log.error("Error: '%s' on line %s of '%s' is not an IP address", ns, lineno, resolvers_path)
+            return []
+        nameservers.append(ns)
 
-def resolve_subdomain(subdomain_to_check, timeout, verbose):
-    """Attempts to resolve a subdomain. Returns IP if successful, None otherwise."""
+    if not nameservers:
+        log.error("Error: No nameservers listed in '%s'", resolvers_path)
+    return nameservers
+
+async def detect_wildcard(resolver, domain):
+    """
+    Resolves a random label that is almost certainly not registered under the domain.
+    Returns the IPs a wildcard record answers with, or an empty set if there is none.
+    """
+    probe = f"{secrets.token_hex(10)}.{domain}"
     try:
-        # Using gethostbyname_ex for potentially more info, though gethostbyname is often enough
-        # It also helps to distinguish between NXDOMAIN and other errors better than gethostbyname alone.
-        hostname, aliaslist, ipaddrlist = socket.gethostbyname_ex(subdomain_to_check)
-        print_message(f"Resolved: {subdomain_to_check} -> {ipaddrlist[0]}", verbose, is_verbose_msg=True)
-        return subdomain_to_check # Return the subdomain itself if found
-    except socket.gaierror: # Host not found (NXDOMAIN)
-        print_message(f"No record for: {subdomain_to_check}", verbose, is_verbose_msg=True)
-        return None
-    except socket.timeout:
-        print_message(f"Timeout resolving: {subdomain_to_check}", verbose, is_verbose_msg=True)
+        answers = await resolver.query(probe, 'A')
+    except aiodns.error.DNSError:
+        return frozenset()
+
+    wildcard_ips = frozenset(answer.host for answer in answers)
+    log.debug("Warning: %s has wildcard DNS (*.%s -> %s); results resolving only to these IPs will be ignored.",
+              domain, domain, ', '.join(sorted(wildcard_ips)))
+    return wildcard_ips
+
+async def resolve_subdomain(resolver, subdomain_to_check, wildcard_ips=frozenset()):
+    """Attempts to resolve a subdomain. Returns the subdomain if successful, None otherwise."""
+    try:
+        # A single A query; c-ares multiplexes it with every other in-flight query on the event loop
+        answers = await resolver.query(subdomain_to_check, 'A')
+    except aiodns.error.DNSError as e:
+        # e.args is (code, message); only NXDOMAIN and NODATA mean the name has no record
+        code = e.args[0] if e.args else None
+        if code in (aiodns.error.ARES_ENOTFOUND, aiodns.error.ARES_ENODATA):
+            log.debug("No record for: %s", subdomain_to_check)
+        elif code == aiodns.error.ARES_ETIMEOUT:
+            log.debug("Timeout resolving: %s", subdomain_to_check)
+        else:
+            # SERVFAIL, REFUSED, connection errors...: says nothing about the name itself
+            log.debug("Error resolving %s: %s", subdomain_to_check, e)
         return None
     except Exception as e:
-        print_message(f"Error resolving {subdomain_to_check}: {e}", verbose, is_verbose_msg=True)
+        log.debug("Error resolving %s: %s", subdomain_to_check, e)
         return None
+    ipaddrs = frozenset(answer.host for answer in answers)
 
-def worker_bruteforce(domain, word_queue, found_subdomains_set, results_list, timeout, verbose):
-    """Worker function for threaded brute-forcing."""
-    while not word_queue.empty():
-        try:
-            word = word_queue.get_nowait()
-        except Exception: # Should ideally be queue.Empty, but get_nowait can be tricky
-            return
-
-        subdomain = f"{word}.{domain}"
-        if resolve_subdomain(subdomain, timeout, verbose):
-            if subdomain not in found_subdomains_set:
-                found_subdomains_set.add(subdomain)
-                results_list.append(subdomain)
-        word_queue.task_done()
+    # Under wildcard DNS every name resolves; only addresses outside the wildcard set mean a real host
+    if ipaddrs <= wildcard_ips:
+        log.debug("Wildcard match for: %s", subdomain_to_check)
+        return None
 
+    log.debug("Resolved: %s -> %s", subdomain_to_check, ', '.join(sorted(ipaddrs)))
+    return subdomain_to_check # Return the subdomain itself if found
 
-def brute_force_subdomains(domain, wordlist_path, num_threads, timeout, verbose):
+@contextmanager
+def map_lines(wordlist_file):
+    """
+    Memory-maps a wordlist opened in binary mode and yields an iterator over its raw lines,
+    so the OS page cache rather than Python holds the file. Pipes and empty files can't
+    be mapped and are read from the file object directly.
+    """
+    st = os.fstat(wordlist_file.fileno())
+    if not stat.S_ISREG(st.st_mode) or not st.st_size:
+        yield wordlist_file
+        return
+    with mmap.mmap(wordlist_file.fileno(), 0, access=mmap.ACCESS_READ) as wordlist_map:
+        yield iter(wordlist_map.readline, b'')
+
+def iter_words(lines):
+    """Yields stripped, non-empty words from raw byte lines, decoding only the line being handed out."""
+    for line in lines:
+        word = line.strip()
+        if word:
+            # Undecodable bytes become U+FFFD rather than aborting the scan halfway through the file
+            yield word.decode(errors='replace')
+
+async def brute_force_subdomains(domain, wordlist_path, concurrency, timeout, nameservers=None, known=None, case_sensitive=False):
     """
     Performs DNS brute-forcing for subdomains.
+    Queries are spread across `nameservers` (system resolvers if None).
+    Words whose subdomain is already in `known` (e.g. found on crt.sh) are not queried.
+    Duplicate words are queried once; unless `case_sensitive`, words are lower-cased first.
     Returns a list of found subdomains.
     """
-    found_subdomains_set = set() # For quick deduplication during threading
-    results_list = []
-    word_queue = Queue()
-
-    print_message(f"Starting DNS brute-force for {domain} with {num_threads} threads...", verbose, is_verbose_msg=True)
+    log.debug("Starting DNS brute-force for %s with up to %s concurrent queries...", domain, concurrency)
 
     try:
-        with open(wordlist_path, 'r') as f:
-            words = [line.strip() for line in f if line.strip()]
-            if not words:
-                print_message("Wordlist is empty or contains only whitespace.", verbose, is_verbose_msg=True)
-                return []
-            for word in words:
-                word_queue.put(word)
+        wordlist_file = open(wordlist_path, 'rb')
     except FileNotFoundError:
-        print_message(f"Error: Wordlist file not found at '{wordlist_path}'", file=sys.stderr)
+        log.error("Error: Wordlist file not found at '%s'", wordlist_path)
         return []
     except Exception as e:
-        print_message(f"Error reading wordlist: {e}", file=sys.stderr)
+        log.error("Error reading wordlist: %s", e)
         return []
 
-    print_message(f"Loaded {word_queue.qsize()} words from wordlist.", verbose, is_verbose_msg=True)
-
-    with concurrent.futures.ThreadPoolExecutor(max_workers=num_threads) as executor:
-        futures = []
-        for _ in range(num_threads):
-            futures.append(executor.submit(worker_bruteforce, domain, word_queue, found_subdomains_set, results_list, timeout, verbose))
-
-        # Wait for all tasks in the queue to be processed
-        word_queue.join()
-
-        # Optional: Wait for futures to complete (they should if queue.join() worked)
-        # for future in concurrent.futures.as_completed(futures):
-        #     pass
+    # One resolver per nameserver, so load fans out across recursors instead of
+    # queueing behind a single one. Without a list, c-ares uses the system configuration.
+    if nameservers:
+        resolvers = [aiodns.DNSResolver(nameservers=[ns], timeout=timeout, tries=1) for ns in nameservers]
+        log.debug("Spreading queries across %s nameservers.", len(resolvers))
+    else:
+        resolvers = [aiodns.DNSResolver(timeout=timeout, tries=1)]
+    wildcard_ips = await detect_wildcard(resolvers[0], domain)
+    words_read = 0
+    words_unique = 0
+    words_tried = 0
+    words_skipped = 0
+    seen_words = set() # Grows with the unique words only, never with the whole file
+    suffix = "." + domain # Built once rather than formatting "{word}.{domain}" for every word
+    if known is None:
+        known = set()
+
+    async def worker(resolver):
+        """Returns the subdomains this worker found; nothing is shared between workers but the word iterator."""
+        nonlocal words_read, words_unique, words_tried, words_skipped
+        found = []
+        # Workers pull from one shared iterator, so each word is handed out exactly once
+        # without a queue, a semaphore or a task per word
+        for word in words:
+            words_read += 1
+            if not case_sensitive:
+                word = word.lower() # DNS names are case-insensitive, so "WWW" and "www" are one query
+            if word in seen_words:
+                continue
+            seen_words.add(word)
+            words_unique += 1
+            hostname = word + suffix
+            if hostname.lower() in known:
+                words_skipped += 1
+                continue
+            words_tried += 1 # Counts only words actually sent to a resolver
+            subdomain = await resolve_subdomain(resolver, hostname, wildcard_ips)
+            if subdomain:
+                found.append(subdomain)
+        return found
+
+    # The number of workers is the cap on in-flight queries; they are dealt to the resolvers round-robin
+    with wordlist_file, map_lines(wordlist_file) as lines:
+        # Words are read lazily as workers ask for them, so the wordlist is never held in memory
+        words = iter_words(lines)
+        per_worker = await asyncio.gather(*(worker(resolvers[i % len(resolvers)]) for i in range(concurrency)))
+
+    if not words_read:
+        log.debug("Wordlist is empty or contains only whitespace.")
+        return []
 
-    print_message("DNS brute-force scan complete.", verbose, is_verbose_msg=True)
-    return results_list
+    if words_read != words_unique:
+        log.debug("Deduplicated %s -> %s words.", words_read, words_unique)
+    if words_skipped:
+        log.debug("Skipped %s words already found on crt.sh.", words_skipped)
+    log.debug("DNS brute-force scan complete (%s words tried).", words_tried)
+    return list(set(chain.from_iterable(per_worker)))
 
-def fetch_crtsh_subdomains(domain, verbose):
+def fetch_crtsh_subdomains(domain, found_subdomains=None, cancelled=None):
     """
     Fetches subdomains from crt.sh.
+    If a `found_subdomains` set is given, names are added to it as they are parsed,
+    so a concurrent brute-force can skip them.
+    Once the `cancelled` event is set, parsing stops and errors are no longer reported.
     Returns a list of unique subdomains.
     """
-    print_message(f"Fetching subdomains from crt.sh for {domain}...", verbose, is_verbose_msg=True)
-    found_subdomains = set()
+    log.debug("Fetching subdomains from crt.sh for %s...", domain)
+    if found_subdomains is None:
+        found_subdomains = set()
+    if cancelled is None:
+        cancelled = threading.Event()
     url = CRTSH_URL.format(domain=domain)
-    headers = {'User-Agent': USER_AGENT}
+    suffix = "." + domain.lower() # Leading dot rejects the apex itself and lookalikes such as "evil-example.com"
 
     try:
-        response = requests.get(url, headers=headers, timeout=15) # Increased timeout for crt.sh
-        response.raise_for_status()  # Raise HTTPError for bad responses (4xx or 5xx)
-        
-        data = response.json()
-        for entry in data:
-            name_value = entry.get('name_value', '')
-            # crt.sh can return multiple subdomains in one name_value, newline separated
-            subdomains_in_entry = name_value.split('\n')
-            for sub in subdomains_in_entry:
-                sub = sub.strip()
-                # Ensure it's actually a subdomain of the target and not the target itself or a wildcard entry
-                if sub and domain in sub and sub != domain and not sub.startswith('*.'):
-                    found_subdomains.add(sub)
-                    
+        # Stream the body when ijson can consume it incrementally
+        with _session.get(url, timeout=CRTSH_TIMEOUT, stream=ijson is not None) as response:
+            response.raise_for_status()  # Raise HTTPError for bad responses (4xx or 5xx)
+
+            if ijson is not None:
+                response.raw.decode_content = True # Let urllib3 undo the gzip transfer encoding
+                entries = ijson.items(response.raw, 'item')
+            else:
+                entries = _json_loads(response.content)
+
+            for entry in entries:
+                if cancelled.is_set():
+                    break
+                name_value = entry.get('name_value', '')
+                # crt.sh can return multiple subdomains in one name_value, newline separated
+                subdomains_in_entry = name_value.split('\n')
+                for sub in subdomains_in_entry:
+                    sub = sub.strip().lower()
+                    # Ensure it's actually a subdomain of the target and not the target itself or a wildcard entry
+                    if sub.endswith(suffix) and not sub.startswith('*.'):
+                        found_subdomains.add(sub)
+
     except requests.exceptions.RequestException as e:
-        print_message(f"Error fetching from crt.sh: {e}", file=sys.stderr)
-    except ValueError: # Includes JSONDecodeError
-        print_message(f"Error parsing JSON response from crt.sh. Response text: {response.text[:200]}...", file=sys.stderr)
+        if not cancelled.is_set():
+            log.error("Error fetching from crt.sh: %s", e)
+    except _JSON_ERRORS as e: # json/orjson's JSONDecodeError, or ijson's JSONError on a non-JSON or cut-off body
+        if not cancelled.is_set():
+            log.error("Error parsing JSON response from crt.sh: %s", e)
     except Exception as e:
-        print_message(f"An unexpected error occurred with crt.sh: {e}", file=sys.stderr)
+        if not cancelled.is_set():
+            log.error("An unexpected error occurred with crt.sh: %s", e)
 
 
-    print_message(f"Found {len(found_subdomains)} unique subdomains from crt.sh.", verbose, is_verbose_msg=True)
+    log.debug("Found %s unique subdomains from crt.sh.", len(found_subdomains))
     return list(found_subdomains)
 
+async def run_in_daemon_thread(func, *args):
+    """
+    Runs a blocking call on a daemon thread and awaits its result.
+    Unlike asyncio.to_thread, a cancelled await doesn't keep the interpreter alive
+    until the call returns, so Ctrl-C exits at once even mid-download.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def settle(setter, value):
+        if not future.done(): # Already cancelled if the user interrupted
+            setter(value)
+
+    def target():
+        try:
+            outcome = (future.set_result, func(*args))
+        except Exception as e:
+            outcome = (future.set_exception, e)
+        try:
+            loop.call_soon_threadsafe(settle, *outcome)
+        except RuntimeError: # Loop already closed; nothing is waiting for the result any more
+            pass
+
+    threading.Thread(target=target, daemon=True).start()
+    return await future
+
+async def run_discovery(args, run_passive, run_active, nameservers):
+    """
+    Runs passive and active discovery concurrently, so the total wall time is
+    the slower of the two rather than their sum.
+    Returns a list of result lists, one per discovery method that ran.
+    """
+    tasks = []
+    # Filled by the crt.sh thread while the brute-force reads it; set add and lookup are atomic under the GIL
+    crtsh_found = set()
+    crtsh_cancelled = threading.Event()
+    if run_passive:
+        # crt.sh is a blocking HTTP call; a worker thread lets its wait overlap the DNS brute-force
+        tasks.append(run_in_daemon_thread(fetch_crtsh_subdomains, args.domain, crtsh_found, crtsh_cancelled))
+
+    if run_active:
+        if not args.wordlist:
+            log.warning("No wordlist provided. Skipping DNS brute-force. Use -w to specify one.")
+        else:
+            tasks.append(brute_force_subdomains(args.domain, args.wordlist, args.concurrency, args.timeout, nameservers, crtsh_found, args.case_sensitive))
+
+    try:
+        return await asyncio.gather(*tasks)
+    except asyncio.CancelledError:
+        # Interrupted by the user: the abandoned crt.sh thread must stop parsing and stay quiet
+        crtsh_cancelled.set()
+        raise
+
+def run_async(coro):
+    """Runs a coroutine to completion, on uvloop when it is installed."""
+    if uvloop is None:
+        return asyncio.run(coro)
+    if sys.version_info >= (3, 12):
+        return asyncio.run(coro, loop_factory=uvloop.new_event_loop)
+    # loop_factory is 3.12+; older Pythons can only switch loops through the event-loop policy
+    uvloop.install()
+    return asyncio.run(coro)
+
 def main():
     parser = argparse.ArgumentParser(description="CLI Subdomain Finder Tool")
     parser.add_argument("-d", "--domain", required=True, help="Target domain (e.g., example.com)")
     parser.add_argument("-w", "--wordlist", help="Path to a wordlist file for brute-forcing")
     parser.add_argument("-o", "--output", help="Output file to save results")
-    parser.add_argument("-t", "--threads", type=int, default=DEFAULT_THREADS, help=f"Number of threads for brute-forcing (default: {DEFAULT_THREADS})")
+    parser.add_argument("-c", "--concurrency", type=positive_int, default=DEFAULT_CONCURRENCY, help=f"Maximum concurrent DNS queries for brute-forcing (default: {DEFAULT_CONCURRENCY})")
+    parser.add_argument("-t", "--threads", type=positive_int, dest="concurrency", default=argparse.SUPPRESS, help=argparse.SUPPRESS) # Old name for --concurrency
     parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help=f"DNS resolution timeout in seconds (default: {DEFAULT_TIMEOUT})")
+    parser.add_argument("-r", "--resolvers", help="File of nameserver IPs (one per line) to spread brute-force queries across")
+    parser.add_argument("--case-sensitive", action="store_true", help="Keep wordlist case as-is instead of lower-casing words before deduplication")
     parser.add_argument("--passive-only", action="store_true", help="Only perform passive discovery (crt.sh)")
     parser.add_argument("--active-only", action="store_true", help="Only perform active discovery (DNS brute-force)")
     parser.add_argument("-v", "--verbose", action="store_true", help="Enable verbose output")
@@ -152,13 +371,19 @@ def main():
         sys.exit(1)
         
     args = parser.parse_args()
+    # Configured once; disabled debug calls return before their arguments are formatted.
+    # Only our logger goes to DEBUG with -v, so asyncio/urllib3 debug chatter stays out.
+    logging.basicConfig(level=logging.INFO, stream=sys.stderr, format="[*] %(message)s")
+    log.setLevel(logging.DEBUG if args.verbose else logging.INFO)
+    # DNS names are case-insensitive; one spelling keeps crt.sh and brute-force hits from duplicating each other
+    args.domain = args.domain.lower()
 
     if args.passive_only and args.active_only:
-        print_message("Error: Cannot use --passive-only and --active-only together.", file=sys.stderr)
+        log.error("Error: Cannot use --passive-only and --active-only together.")
         sys.exit(1)
 
     if args.active_only and not args.wordlist:
-        print_message("Error: --wordlist is required for --active-only mode.", file=sys.stderr)
+        log.error("Error: --wordlist is required for --active-only mode.")
         parser.print_help(sys.stderr)
         sys.exit(1)
     
@@ -171,50 +396,42 @@ def main():
     if args.active_only:
         run_passive = False
 
+    nameservers = None
+    if run_active and args.resolvers:
+        nameservers = load_resolvers(args.resolvers)
+        if not nameservers:
+            sys.exit(1)
+
 
     all_found_subdomains = set()
     start_time = time.time()
 
-    # Set global socket timeout
-    socket.setdefaulttimeout(args.timeout)
-
-    if run_passive:
-        crtsh_results = fetch_crtsh_subdomains(args.domain, args.verbose)
-        for sub in crtsh_results:
-            all_found_subdomains.add(sub)
+    for results in run_async(run_discovery(args, run_passive, run_active, nameservers)):
+        all_found_subdomains.update(results)
 
-    if run_active:
-        if not args.wordlist:
-            print_message("Warning: No wordlist provided. Skipping DNS brute-force. Use -w to specify one.", file=sys.stderr)
-        else:
-            bruteforce_results = brute_force_subdomains(args.domain, args.wordlist, args.threads, args.timeout, args.verbose)
-            for sub in bruteforce_results:
-                all_found_subdomains.add(sub)
-    
     if not all_found_subdomains:
-        print_message(f"\nNo subdomains found for {args.domain}.", verbose=True) # Always print this if nothing found
+        log.info("No subdomains found for %s.", args.domain) # Always print this if nothing found
     else:
-        print_message(f"\n--- Found {len(all_found_subdomains)} Unique Subdomain(s) ---", verbose=True)
-        sorted_subdomains = sorted(list(all_found_subdomains))
-        for sub in sorted_subdomains:
-            print(sub) # Print to stdout for easy piping
+        log.info("--- Found %s Unique Subdomain(s) ---", len(all_found_subdomains))
+        # Joined once and written in one call rather than a print()/write() per line
+        results_text = "\n".join(sorted(all_found_subdomains)) + "\n"
+        sys.stdout.write(results_text) # Print to stdout for easy piping
 
         if args.output:
             try:
                 with open(args.output, 'w') as f:
-                    for sub in sorted_subdomains:
-                        f.write(sub + '\n')
-                print_message(f"\nResults saved to {args.output}", verbose=True)
+                    f.write(results_text)
+                log.info("Results saved to %s", args.output)
             except IOError as e:
-                print_message(f"Error writing to output file {args.output}: {e}", file=sys.stderr)
+                log.error("Error writing to output file %s: %s", args.output, e)
 
     end_time = time.time()
-    print_message(f"Scan completed in {end_time - start_time:.2f} seconds.", args.verbose, is_verbose_msg=True)
+    log.debug("Scan completed in %.2f seconds.", end_time - start_time)
 
 
 if __name__ == "__main__":
     try:
         main()
     except KeyboardInterrupt:
-        print_message("\nProcess interrupted by user. Exiting.", file=sys.stderr)
+        log.error("Process interrupted by user. Exiting.")
         sys.exit(1)
\ No newline at end of file